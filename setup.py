@@ -14,5 +14,12 @@ setup(name='steely',
             "fastapi"
           ]
       ],
+      extras_require={
+          "dev": [
+            "pytest",
+            "pytest-asyncio",
+            "pytest-xdist"
+          ]
+      },
       include_package_data=True,
       )
\ No newline at end of file
@@ -14,6 +14,11 @@ TypeColors
 Symbols
     Unicode symbols for visual elements like arrows, boxes, and indicators.
 
+Functions
+---------
+supports_color
+    Whether ANSI colors should be written to a stream.
+
 Examples
 --------
 Using colors in terminal output:
@@ -39,9 +44,48 @@ Notes
 These colors use ANSI escape sequences which are supported by most modern
 terminals. On Windows, you may need to enable ANSI support or use a
 compatible terminal emulator.
+
+Colors are only worth emitting on a terminal; ``supports_color`` reports
+False for pipes and files. Set ``NO_COLOR`` to disable colors everywhere or
+``STEELY_FORCE_COLOR`` to keep them when output is redirected.
 """
 
-__all__ = ["UnicodeColor", "UnicodeColors", "TypeColors", "Symbols"]
+import os
+import sys
+
+__all__ = ["UnicodeColor", "UnicodeColors", "TypeColors", "Symbols", "supports_color"]
+
+
+def supports_color(stream=None) -> bool:
+    """
+    Check whether ANSI colors should be written to a stream.
+
+    Parameters
+    ----------
+    stream : file-like, optional
+        The stream to check. Default is sys.stdout.
+
+    Returns
+    -------
+    bool
+        True if ``STEELY_FORCE_COLOR`` is set, False if ``NO_COLOR`` is set,
+        otherwise whether the stream is a TTY.
+
+    Examples
+    --------
+    >>> supports_color()  # In an interactive terminal
+    True
+    """
+    if os.environ.get("STEELY_FORCE_COLOR"):
+        return True
+    if os.environ.get("NO_COLOR"):
+        return False
+
+    stream = sys.stdout if stream is None else stream
+    try:
+        return stream.isatty()
+    except (AttributeError, ValueError):
+        return False
 
 
 class UnicodeColor:
@@ -252,6 +296,8 @@ class TypeColors:
 
         Notes
         -----
+        - Built-in types are looked up by exact type in a single dict hit;
+          subclasses go through the isinstance checks below
         - Boolean is checked before int because bool is a subclass of int
         - Callable check comes after specific types to avoid false positives
         - Unknown types default to CLASS color (lavender)
@@ -265,6 +311,11 @@ class TypeColors:
         >>> TypeColors.get_color(None)
         '\\033[38;5;245m'  # Gray for None
         """
+        # Attribute names rather than colors, so subclasses can override them
+        name = _TYPE_COLOR_NAMES.get(type(value))
+        if name is not None:
+            return getattr(cls, name)
+
         if value is None:
             return cls.NONE
         elif isinstance(value, bool):
@@ -289,6 +340,20 @@ class TypeColors:
             return cls.CLASS
 
 
+# Exact type -> TypeColors attribute for the common built-in types
+_TYPE_COLOR_NAMES = {
+    type(None): "NONE",
+    bool: "BOOL",
+    int: "INT",
+    float: "FLOAT",
+    str: "STR",
+    list: "LIST",
+    dict: "DICT",
+    tuple: "TUPLE",
+    set: "SET",
+}
+
+
 class Symbols:
     """
     Unicode symbols for beautiful terminal output.
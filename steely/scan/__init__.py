@@ -64,8 +64,9 @@ Output example::
 
 Notes
 -----
-- The scan decorator uses sys.settrace which may affect performance.
-  Use primarily for debugging, not in production.
+- The scan decorator uses sys.monitoring (Python 3.12+) or sys.settrace,
+  which may affect performance. Use primarily for debugging, not in
+  production.
 - The original function signature is preserved for framework compatibility.
 - Internal variables (starting with _) are automatically filtered out.
 """
@@ -73,14 +74,38 @@ Notes
 import asyncio
 import inspect
 import sys
+import threading
+import time
 from functools import wraps
-from datetime import datetime
+from itertools import islice
 from typing import Any, Dict, Optional, Set
 
-from steely.design import UnicodeColors, TypeColors, Symbols
+from steely.design import UnicodeColors, TypeColors, Symbols, supports_color
 
 __all__ = ["scan", "ScanPrinter", "VariableTracker"]
 
+# sys.monitoring (Python 3.12+) only reports events for the code objects it is
+# enabled on, so calls into helpers never reach Python code. sys.settrace, the
+# fallback, calls the tracer for every function call made in the thread.
+_monitoring = getattr(sys, "monitoring", None)
+_TOOL_IDS = (4, 3)  # Free slots; 0-2 and 5 are reserved for debuggers, coverage, profilers, optimizers
+_tool_id = None  # Acquired on first use; False when monitoring is unavailable
+_tool_lock = threading.Lock()
+_trackers: Dict[Any, list] = {}  # code object -> active trackers, innermost last
+_MISSING = object()  # Marks a name absent from the previous locals snapshot
+_line_tables: Dict[Any, dict] = {}  # code object -> {bytecode offset: line}, for JUMP events
+
+# Type names by exact type: one dict lookup instead of a chain of isinstance()
+_SCALAR_TYPE_NAMES = {t: t.__name__ for t in (int, float, bool, complex, bytes, type(None))}
+_SIZED_TYPE_BRACKETS = {
+    list: ("list[", "]"),
+    tuple: ("tuple[", "]"),
+    set: ("set[", "]"),
+    frozenset: ("frozenset[", "]"),
+    str: ("str[", "]"),
+    dict: ("dict{", "}"),
+}
+
 
 class ScanPrinter:
     """
@@ -123,10 +148,10 @@ class ScanPrinter:
             The module name where the function is defined.
         """
         width = 60
-        print()
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_TL}{cls.S.BOX_H * (width - 2)}{cls.S.BOX_TR}{cls.C.reset}")
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.SCAN} {cls.C.bold}{cls.C.bright_yellow}SCAN{cls.C.reset} {cls.C.dim}│{cls.C.reset} {cls.C.bright_white}{func_name}{cls.C.reset} {cls.C.dim}@ {module}{cls.C.reset}")
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * (width - 2)}{cls.S.BOX_R}{cls.C.reset}")
+        # One print per block: a line-buffered terminal flushes once per print
+        print(f"\n{cls.C.bright_cyan}{cls.S.BOX_TL}{cls.S.BOX_H * (width - 2)}{cls.S.BOX_TR}{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.SCAN} {cls.C.bold}{cls.C.bright_yellow}SCAN{cls.C.reset} {cls.C.dim}│{cls.C.reset} {cls.C.bright_white}{func_name}{cls.C.reset} {cls.C.dim}@ {module}{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * (width - 2)}{cls.S.BOX_R}{cls.C.reset}")
 
     @classmethod
     def signature(cls, sig: inspect.Signature, args: tuple, kwargs: dict, param_names: list):
@@ -178,6 +203,15 @@ class ScanPrinter:
         str
             The formatted (and possibly truncated) value representation.
         """
+        # Each item renders as at least three characters, so the repr of the
+        # first max_len items already runs past the cut: render only those
+        # instead of building the repr of a large container and slicing it
+        value_type = type(value)
+        if value_type is list or value_type is tuple:
+            if len(value) > max_len:
+                value = value[:max_len]
+        elif value_type is dict and len(value) > max_len:
+            value = dict(islice(value.items(), max_len))
         repr_val = repr(value)
         if len(repr_val) > max_len:
             repr_val = repr_val[:max_len - 1] + cls.S.ELLIPSIS
@@ -198,6 +232,14 @@ class ScanPrinter:
         str
             Type name like 'int', 'list[3]', 'dict{2}', 'str[10]'.
         """
+        name = _SCALAR_TYPE_NAMES.get(type(value))
+        if name is not None:
+            return name
+        brackets = _SIZED_TYPE_BRACKETS.get(type(value))
+        if brackets is not None:
+            return f"{brackets[0]}{len(value)}{brackets[1]}"
+
+        # Subclasses and other types
         t = type(value).__name__
         if isinstance(value, (list, tuple, set, frozenset)):
             return f"{t}[{len(value)}]"
@@ -225,7 +267,7 @@ class ScanPrinter:
         line_no : int, optional
             The line number where the assignment occurred.
         """
-        color = TypeColors.get_color(value)
+        color = cls.T.get_color(value)
         type_name = cls._get_type_name(value)
         formatted_val = cls._format_value(value)
 
@@ -256,7 +298,7 @@ class ScanPrinter:
         line_no : int
             The line number where the change occurred.
         """
-        color = TypeColors.get_color(new_value)
+        color = cls.T.get_color(new_value)
         type_name = cls._get_type_name(new_value)
         formatted_new = cls._format_value(new_value)
         formatted_old = cls._format_value(old_value, max_len=20)
@@ -319,12 +361,12 @@ class ScanPrinter:
         value : Any
             The value being returned by the function.
         """
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}")
-        color = TypeColors.get_color(value)
+        color = cls.T.get_color(value)
         type_name = cls._get_type_name(value)
         formatted_val = cls._format_value(value)
 
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.RETURN} {cls.C.bright_green}return{cls.C.reset} "
+        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.RETURN} {cls.C.bright_green}return{cls.C.reset} "
               f"{cls.C.dim}:{cls.C.reset} "
               f"{cls.C.yellow}{type_name}{cls.C.reset} "
               f"{cls.C.dim}={cls.C.reset} "
@@ -340,8 +382,8 @@ class ScanPrinter:
         exc : Exception
             The exception that was raised.
         """
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}")
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.CROSS} {cls.C.bright_red}Exception{cls.C.reset} "
+        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.CROSS} {cls.C.bright_red}Exception{cls.C.reset} "
               f"{cls.C.dim}:{cls.C.reset} "
               f"{cls.C.yellow}{type(exc).__name__}{cls.C.reset} "
               f"{cls.C.dim}-{cls.C.reset} "
@@ -357,11 +399,120 @@ class ScanPrinter:
         elapsed_ms : float
             The elapsed time in milliseconds.
         """
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}")
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.CHECK} {cls.C.dim}Completed in{cls.C.reset} "
-              f"{cls.C.bright_green}{elapsed_ms:.3f}ms{cls.C.reset}")
-        print(f"{cls.C.bright_cyan}{cls.S.BOX_BL}{cls.S.BOX_H * 58}{cls.S.BOX_BR}{cls.C.reset}")
-        print()
+        print(f"{cls.C.bright_cyan}{cls.S.BOX_L}{cls.S.BOX_H * 58}{cls.S.BOX_R}{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_V}{cls.C.reset} {cls.S.CHECK} {cls.C.dim}Completed in{cls.C.reset} "
+              f"{cls.C.bright_green}{elapsed_ms:.3f}ms{cls.C.reset}\n"
+              f"{cls.C.bright_cyan}{cls.S.BOX_BL}{cls.S.BOX_H * 58}{cls.S.BOX_BR}{cls.C.reset}\n")
+
+
+class _NoColors:
+    """Stand-in for UnicodeColors and TypeColors that renders every color as ""."""
+
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+    @staticmethod
+    def get_color(value: Any) -> str:
+        return ""
+
+
+class _PlainScanPrinter(ScanPrinter):
+    """ScanPrinter without ANSI escapes, used when stdout does not support color."""
+
+    C = _NoColors()
+    T = C
+
+
+def _printer():
+    """Pick the printer for one scanned call, following supports_color()."""
+    return ScanPrinter if supports_color() else _PlainScanPrinter
+
+
+def _acquire_tool_id():
+    """Claim a sys.monitoring tool id for scan, once per process."""
+    global _tool_id
+    if _tool_id is None:
+        with _tool_lock:
+            if _tool_id is None:
+                tool_id = False
+                if _monitoring is not None:
+                    for candidate in _TOOL_IDS:
+                        try:
+                            _monitoring.use_tool_id(candidate, "steely-scan")
+                        except ValueError:
+                            continue
+                        events = _monitoring.events
+                        _monitoring.register_callback(candidate, events.PY_START, _on_start)
+                        _monitoring.register_callback(candidate, events.LINE, _on_line)
+                        _monitoring.register_callback(candidate, events.JUMP, _on_jump)
+                        _monitoring.register_callback(candidate, events.PY_RETURN, _on_return)
+                        tool_id = candidate
+                        break
+                _tool_id = tool_id
+    return _tool_id
+
+
+def _current_tracker(code):
+    """Get the innermost tracker of ``code`` started by the calling thread."""
+    stack = _trackers.get(code)
+    if stack:
+        ident = threading.get_ident()
+        for tracker in reversed(stack):
+            if tracker.thread == ident:
+                return tracker
+    return None
+
+
+def _on_start(code, offset):
+    """PY_START: a tracked function was entered."""
+    tracker = _current_tracker(code)
+    if tracker is not None:
+        tracker.trace_calls(sys._getframe(1), 'call', None)
+
+
+def _on_line(code, line_number):
+    """LINE: a new line of a tracked function is about to run."""
+    tracker = _current_tracker(code)
+    if tracker is not None:
+        tracker.trace_lines(sys._getframe(1), 'line', None)
+
+
+def _line_table(code) -> dict:
+    """Map every bytecode offset of ``code`` to its line, built once per code object."""
+    table = _line_tables.get(code)
+    if table is None:
+        table = {}
+        for start, end, line in code.co_lines():
+            for offset in range(start, end, 2):
+                table[offset] = line
+        _line_tables[code] = table
+    return table
+
+
+def _on_jump(code, offset, destination):
+    """
+    JUMP: re-report a line that a backward jump runs again.
+
+    LINE does not fire when a loop jumps back onto the line it is on, while
+    sys.settrace reports a 'line' event there. As in CPython's own settrace
+    emulation, only such same-line backward jumps count as line events; every
+    other jump is disabled at its location after the first time it is seen.
+    """
+    if destination > offset:
+        return _monitoring.DISABLE
+    lines = _line_table(code)
+    if lines.get(offset) != lines.get(destination):
+        return _monitoring.DISABLE  # LINE reports the destination line
+    tracker = _current_tracker(code)
+    if tracker is not None:
+        tracker.trace_lines(sys._getframe(1), 'line', None)
+
+
+def _on_return(code, offset, retval):
+    """PY_RETURN: a tracked function is returning."""
+    tracker = _current_tracker(code)
+    if tracker is not None:
+        tracker.trace_lines(sys._getframe(1), 'return', retval)
 
 
 class VariableTracker:
@@ -376,6 +527,8 @@ class VariableTracker:
     ----------
     target_func_code : code
         The code object of the function to track (func.__code__).
+    printer : type, optional
+        The ScanPrinter class that reports changes. Default is ScanPrinter.
 
     Attributes
     ----------
@@ -389,19 +542,65 @@ class VariableTracker:
         List of recorded changes (tuples of change info).
     active : bool
         Whether tracking is currently active.
+    thread : int or None
+        Identifier of the thread that started tracking.
+    printer : type
+        The ScanPrinter class that reports changes.
 
     Notes
     -----
     This class is used internally by the scan decorator and should not
-    typically be instantiated directly.
+    typically be instantiated directly. start() enables sys.monitoring
+    events on the target code object only, so frames of other functions
+    cost nothing; without sys.monitoring it installs trace_calls() with
+    sys.settrace.
     """
 
-    def __init__(self, target_func_code):
+    def __init__(self, target_func_code, printer=ScanPrinter):
         self.target_code = target_func_code
+        self.printer = printer
         self.previous_locals: Dict[str, Any] = {}
         self.tracked_names: Set[str] = set()
         self.changes: list = []
         self.active = False
+        self.thread = None
+        self._monitored = False
+        self._old_trace = None
+
+    def start(self):
+        """Begin tracking the target code in the calling thread."""
+        self.active = True
+        self.thread = threading.get_ident()
+        tool_id = _acquire_tool_id()
+        if tool_id is not False:
+            code = self.target_code
+            with _tool_lock:
+                stack = _trackers.setdefault(code, [])
+                stack.append(self)
+                if len(stack) == 1:
+                    events = _monitoring.events
+                    _monitoring.set_local_events(tool_id, code, events.PY_START | events.LINE | events.JUMP | events.PY_RETURN)
+            self._monitored = True
+        else:
+            self._old_trace = sys.gettrace()
+            sys.settrace(self.trace_calls)
+
+    def stop(self):
+        """Stop tracking and restore the previous tracing state."""
+        if self._monitored:
+            code = self.target_code
+            with _tool_lock:
+                stack = _trackers.get(code, [])
+                if self in stack:
+                    stack.remove(self)
+                if not stack:
+                    _trackers.pop(code, None)
+                    _monitoring.set_local_events(_tool_id, code, 0)
+            self._monitored = False
+        else:
+            sys.settrace(self._old_trace)
+            self._old_trace = None
+        self.active = False
 
     def trace_calls(self, frame, event, arg):
         """
@@ -461,36 +660,45 @@ class VariableTracker:
         if not self.active:
             return None
 
+        # Only line and return events can reveal assignments; 'exception'
+        # events keep the frame traced without touching it
+        if event != 'line' and event != 'return':
+            return self.trace_lines
+
         if frame.f_code is not self.target_code:
             return None
 
-        if event == 'line' or event == 'return':
-            current_locals = frame.f_locals.copy()
-            line_no = frame.f_lineno
-
-            # Detect new and changed variables
-            for name, value in current_locals.items():
-                if name.startswith('_'):
-                    continue
-
-                if name not in self.previous_locals:
-                    # New variable
-                    self.changes.append(('new', name, value, line_no))
-                    ScanPrinter.new_variable(name, value, line_no)
-                elif name in self.previous_locals:
-                    old_val = self.previous_locals[name]
-                    try:
-                        # Check if value changed (handle unhashable types)
-                        if old_val is not value and old_val != value:
-                            self.changes.append(('change', name, old_val, value, line_no))
-                            ScanPrinter.variable_change(name, old_val, value, line_no)
-                    except (TypeError, ValueError):
-                        # For unhashable types, use identity check
-                        if old_val is not value:
-                            self.changes.append(('change', name, old_val, value, line_no))
-                            ScanPrinter.variable_change(name, old_val, value, line_no)
-
-            self.previous_locals = current_locals.copy()
+        current_locals = frame.f_locals.copy()
+        line_no = frame.f_lineno
+
+        # Most lines change one variable at most: an identity pre-filter
+        # skips every unchanged local without hashing or comparing values
+        get = self.previous_locals.get
+        changed = [item for item in current_locals.items() if get(item[0], _MISSING) is not item[1]]
+
+        # Detect new and changed variables
+        for name, value in changed:
+            if name.startswith('_'):
+                continue
+
+            if name not in self.previous_locals:
+                # New variable
+                self.changes.append(('new', name, value, line_no))
+                self.printer.new_variable(name, value, line_no)
+            elif name in self.previous_locals:
+                old_val = self.previous_locals[name]
+                try:
+                    # Check if value changed (handle unhashable types)
+                    if old_val is not value and old_val != value:
+                        self.changes.append(('change', name, old_val, value, line_no))
+                        self.printer.variable_change(name, old_val, value, line_no)
+                except (TypeError, ValueError):
+                    # For unhashable types, use identity check
+                    if old_val is not value:
+                        self.changes.append(('change', name, old_val, value, line_no))
+                        self.printer.variable_change(name, old_val, value, line_no)
+
+        self.previous_locals = current_locals
 
         return self.trace_lines
 
@@ -586,9 +794,12 @@ def scan(func):
 
     Notes
     -----
-    - Uses sys.settrace for tracking, which may impact performance.
-      Best used for debugging, not in production.
+    - Uses sys.monitoring (Python 3.12+) or sys.settrace for tracking,
+      which may impact performance. Best used for debugging, not in
+      production.
     - Variables starting with underscore (_) are filtered out.
+    - Colors follow supports_color(): when stdout is not a terminal the same
+      output is printed without ANSI escape codes.
     - The original function signature is preserved for framework compatibility.
     - Exceptions are displayed and then re-raised.
 
@@ -606,58 +817,57 @@ def scan(func):
     if asyncio.iscoroutinefunction(func):
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            start = datetime.now()
+            start = time.perf_counter_ns()
+            printer = _printer()
 
             # Print header
-            ScanPrinter.header(func.__name__, module_name)
-            ScanPrinter.signature(sig, args, kwargs, param_names)
+            printer.header(func.__name__, module_name)
+            printer.signature(sig, args, kwargs, param_names)
 
             # Note: sys.settrace doesn't work well with async functions
             # because it traces the entire event loop. Variable tracking
             # is disabled for async functions.
-            print(f"{ScanPrinter.C.bright_cyan}{ScanPrinter.S.BOX_V}{ScanPrinter.C.reset} "
-                  f"{ScanPrinter.C.dim}(async function - variable tracking disabled){ScanPrinter.C.reset}")
+            print(f"{printer.C.bright_cyan}{printer.S.BOX_V}{printer.C.reset} "
+                  f"{printer.C.dim}(async function - variable tracking disabled){printer.C.reset}")
 
             try:
                 result = await func(*args, **kwargs)
-                ScanPrinter.return_value(result)
+                printer.return_value(result)
                 return result
             except Exception as e:
-                ScanPrinter.exception(e)
+                printer.exception(e)
                 raise
             finally:
-                elapsed = (datetime.now() - start).total_seconds() * 1000
-                ScanPrinter.footer(elapsed)
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000
+                printer.footer(elapsed)
 
         async_wrapper.__signature__ = sig
         return async_wrapper
     else:
         @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start = datetime.now()
+            start = time.perf_counter_ns()
+            printer = _printer()
 
             # Print header
-            ScanPrinter.header(func.__name__, module_name)
-            ScanPrinter.signature(sig, args, kwargs, param_names)
+            printer.header(func.__name__, module_name)
+            printer.signature(sig, args, kwargs, param_names)
 
             # Set up tracing
-            tracker = VariableTracker(func.__code__)
-            tracker.active = True
-            old_trace = sys.gettrace()
-            sys.settrace(tracker.trace_calls)
+            tracker = VariableTracker(func.__code__, printer)
+            tracker.start()
 
             try:
                 result = func(*args, **kwargs)
-                ScanPrinter.return_value(result)
+                printer.return_value(result)
                 return result
             except Exception as e:
-                ScanPrinter.exception(e)
+                printer.exception(e)
                 raise
             finally:
-                sys.settrace(old_trace)
-                tracker.active = False
-                elapsed = (datetime.now() - start).total_seconds() * 1000
-                ScanPrinter.footer(elapsed)
+                tracker.stop()
+                elapsed = (time.perf_counter_ns() - start) / 1_000_000
+                printer.footer(elapsed)
 
         sync_wrapper.__signature__ = sig
         return sync_wrapper
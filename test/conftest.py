@@ -0,0 +1,5 @@
+import os
+
+# Output is captured (not a TTY) under pytest; keep ANSI colors so the
+# color assertions exercise the same path as an interactive terminal.
+os.environ.setdefault("STEELY_FORCE_COLOR", "1")
@@ -197,6 +197,22 @@ class TestLogDecorator:
 
         assert asyncio.iscoroutinefunction(async_func)
 
+    @pytest.mark.skipif(not hasattr(inspect, "markcoroutinefunction"),
+                        reason="inspect.markcoroutinefunction needs Python 3.12+")
+    def test_decorator_detects_marked_coroutine_function(self):
+        """Test that callables marked with markcoroutinefunction stay async."""
+        async def inner():
+            return "marked"
+
+        @Dan.log
+        @inspect.markcoroutinefunction
+        def marked_func():
+            return inner()
+
+        # The wrapper itself must be async so it can log after the await
+        assert marked_func.__code__.co_flags & inspect.CO_COROUTINE
+        assert asyncio.run(marked_func()) == "marked"
+
     def test_log_uses_module_name(self, capsys):
         """Test that log decorator uses module name in output."""
         @Dan.log
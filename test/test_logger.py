@@ -1,5 +1,7 @@
 import os
+import sys
 import tempfile
+import threading
 from unittest.mock import patch
 
 import pytest
@@ -58,6 +60,29 @@ class TestLoggerInit:
 
         assert logger.kwargs == {"custom_key": "value", "another": "param"}
 
+    def test_logger_kwargs_reassignment_updates_tags(self, capsys):
+        """Test assigning new kwargs changes the tags of later messages."""
+        logger = Logger("owner", "app", region="eu")
+        logger.kwargs = {"region": "us"}
+        logger.info("Message")
+
+        captured = capsys.readouterr()
+        assert "[US]" in captured.out
+        assert "[EU]" not in captured.out
+        assert logger.kwargs == {"region": "us"}
+
+    def test_logger_state_lives_in_slots(self):
+        """Test per-instance state is stored in slots, with no instance dict."""
+        logger = Logger("owner", "app", destination="logs", tag="t")
+
+        assert "path" in Logger.__slots__
+        assert logger.path == "logs"
+        assert not hasattr(logger, "__dict__")
+
+        # Flags are per instance and default independently of other loggers
+        logger.block_when_full = True
+        assert Logger("owner", "app").block_when_full is False
+
     def test_logger_app_name_converted_to_uppercase(self):
         """Test Logger converts app_name to uppercase."""
         logger = Logger("owner", "my-app")
@@ -134,6 +159,36 @@ class TestLoggerLogMethod:
 
         assert "[MYTAG]" in content
         assert "[VALUE]" in content
+        assert content.endswith("[APP] [OWNER] [MYTAG] [VALUE] [INFO]: Message")
+
+    def test_logger_renders_instance_tags_once(self):
+        """Test constructor tags are rendered at construction, in order."""
+        logger = Logger("owner", "app", tag="mytag", stage=2)
+
+        assert logger._static_kwarg_tokens == " [MYTAG] [2]"
+
+    def test_log_suppressed_without_destination_skips_formatting(self, capsys):
+        """Test that fully suppressed messages are not formatted at all."""
+        logger = Logger("owner", "app", debug=False)
+
+        with patch.object(Logger, "_subprocess_log") as mock_subprocess_log:
+            result = logger.log("INFO", "Hidden", supress=True, debug=False, self_debug=False)
+
+            mock_subprocess_log.assert_not_called()
+
+        assert result == ""
+        assert capsys.readouterr().out == ""
+
+    def test_log_suppressed_uses_instance_debug_setting(self, capsys):
+        """Test that self_debug defaults to the debug value the logger was created with."""
+        quiet = Logger("owner", "app", debug=False)
+        chatty = Logger("owner", "app", debug=True)
+
+        quiet.info("Hidden", supress=True, debug=False)
+        assert capsys.readouterr().out == ""
+
+        chatty.info("Shown", supress=True, debug=False)
+        assert "Shown" in capsys.readouterr().out
 
     def test_log_writes_to_file(self):
         """Test log writes to log file when path is set."""
@@ -150,6 +205,19 @@ class TestLoggerLogMethod:
                 content = f.read()
                 assert "File log message" in content
 
+    def test_log_resolves_log_path_once_per_day(self):
+        """Test that the log file path is only resolved again on a new day."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False)
+
+            with patch.object(Logger, "_get_log_path", wraps=logger._get_log_path) as mock_get_log_path:
+                logger.log("INFO", "First", supress=True, debug=False, self_debug=False)
+                logger.log("INFO", "Second", supress=True, debug=False, self_debug=False)
+
+                assert mock_get_log_path.call_count == 1
+
+            assert len(os.listdir(tmpdir)) == 1
+
     def test_log_with_debug_environment(self):
         """Test log creates debug directory when environment is debug."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -164,6 +232,20 @@ class TestLoggerLogMethod:
             import shutil
             shutil.rmtree(expected_dir, ignore_errors=True)
 
+    def test_log_creates_debug_directory_once(self):
+        """Test the debug directory is created on the first write only, even across days."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            destination = os.path.join(tmpdir, "logs")
+            logger = Logger("owner", "app", destination=destination, debug=True)
+
+            with patch("os.makedirs", wraps=os.makedirs) as mock_makedirs:
+                logger.log("INFO", "First", supress=True)
+                logger.log("INFO", "Second", supress=True)
+                logger._get_log_path("01-01-2000")
+
+            mock_makedirs.assert_called_once_with(f"{destination}_debug", exist_ok=True)
+            assert os.path.isdir(f"{destination}_debug")
+
     def test_log_creates_destination_folder(self):
         """Test that logger creates destination folder if it doesn't exist."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -207,6 +289,431 @@ class TestLoggerLogMethod:
         timestamp_pattern = r'\d{2}-\d{2}-\d{4} \d{2}:\d{2}:\d{2}'
         assert re.search(timestamp_pattern, content) is not None
 
+    def test_subprocess_log_uses_record_timestamp(self, capsys):
+        """Test that the line timestamp comes from the captured record, not the write time."""
+        import time
+        logger = Logger("owner", "app")
+        created = time.mktime((2021, 3, 4, 5, 6, 7, 0, 0, -1))
+
+        content = logger._subprocess_log((created, "info", "Message", None, False, True, {}))
+
+        assert "04-03-2021 05:06:07 - [APP] [OWNER] [INFO]: Message" in content
+
+    def test_subprocess_log_fast_path_matches_generic_format(self, capsys):
+        """Test that plain lines and overridden or custom-level ones share the same layout."""
+        import time
+        logger = Logger("owner", "app", tag="mytag")
+        created = time.mktime((2021, 3, 4, 5, 6, 7, 0, 0, -1))
+
+        plain = logger._subprocess_log((created, "INFO", "Message", None, False, True, {}))
+        override = logger._subprocess_log((created, "INFO", "Message", "other", False, True, {}))
+        tagged = logger._subprocess_log((created, "INFO", "Message", None, False, True, {"extra": "value"}))
+        warning = logger._subprocess_log((created, "warning", "Message", None, False, True, {}))
+        custom = logger._subprocess_log((created, "custom", "Message", None, False, True, {}))
+
+        assert plain == "\n04-03-2021 05:06:07 - [APP] [OWNER] [MYTAG] [INFO]: Message"
+        assert override == "\n04-03-2021 05:06:07 - [OTHER] [OWNER] [MYTAG] [INFO]: Message"
+        assert tagged == "\n04-03-2021 05:06:07 - [APP] [OWNER] [MYTAG] [VALUE] [INFO]: Message"
+        assert warning == "\n04-03-2021 05:06:07 - [APP] [OWNER] [MYTAG] [WARNING]: Message"
+        assert custom == "\n04-03-2021 05:06:07 - [APP] [OWNER] [MYTAG] [CUSTOM]: Message"
+
+    def test_subprocess_log_formats_timestamp_once_per_second(self, capsys):
+        """Test that records within the same second reuse the formatted timestamp."""
+        import time
+        logger = Logger("owner", "app")
+        created = time.mktime((2021, 3, 4, 5, 6, 7, 0, 0, -1))
+
+        with patch("steely.logger._ts_cache", [(None, "", "")]), \
+                patch("steely.logger._strftime", wraps=time.strftime) as mock_strftime:
+            logger._subprocess_log((created + 0.1, "INFO", "First", None, False, True, {}))
+            logger._subprocess_log((created + 0.9, "INFO", "Second", None, False, True, {}))
+            assert mock_strftime.call_count == 2
+
+            content = logger._subprocess_log((created + 1.0, "INFO", "Third", None, False, True, {}))
+            assert mock_strftime.call_count == 4
+
+        assert "04-03-2021 05:06:08" in content
+
+    @pytest.mark.skipif(os.name != "posix", reason="raw stdout writes are POSIX only")
+    def test_log_writes_raw_stdout_descriptor(self, capfd, monkeypatch):
+        """Test log writes straight to the stdout descriptor when stdout is not replaced."""
+        logger = Logger("owner", "app")
+        monkeypatch.setattr(sys, "stdout", sys.__stdout__)
+
+        with patch("os.write", wraps=os.write) as mock_write:
+            logger.log("INFO", "Raw message", supress=False, debug=True)
+
+        assert mock_write.call_args[0][0] == sys.__stdout__.fileno()
+        captured = capfd.readouterr()
+        assert "Raw message" in captured.out
+
+    @pytest.mark.skipif(os.name != "posix", reason="raw stdout writes are POSIX only")
+    def test_log_raw_stdout_uses_precomputed_color_bytes(self, capfd, monkeypatch):
+        """Test the raw stdout path frames the line with the pre-encoded color bytes."""
+        from steely.logger import _LEVEL_COLOR_BYTES, _RESET_BYTES
+
+        logger = Logger("owner", "app")
+        monkeypatch.setattr(sys, "stdout", sys.__stdout__)
+
+        with patch("os.write", wraps=os.write) as mock_write:
+            logger.log("ERROR", "Byte message", supress=False, debug=True)
+
+        data = mock_write.call_args[0][1]
+        assert data.startswith(_LEVEL_COLOR_BYTES["ERROR"])
+        assert data.endswith(_RESET_BYTES)
+        assert b"Byte message" in data
+        capfd.readouterr()
+
+
+class TestLoggerBackground:
+    """Tests for the background listener thread."""
+
+    def test_background_log_returns_empty_string(self, capsys):
+        """Test that background logging defers formatting to the listener."""
+        logger = Logger("owner", "app", background=True)
+
+        result = logger.log("INFO", "Queued message", supress=False, debug=True)
+
+        assert result == ""
+        assert Logger.flush(timeout=5) is True
+
+    def test_background_log_written_after_flush(self, capsys):
+        """Test that queued records are written once flushed."""
+        logger = Logger("owner", "app", background=True)
+
+        logger.info("First queued")
+        logger.warning("Second queued")
+        Logger.flush(timeout=5)
+
+        captured = capsys.readouterr()
+        assert captured.out.index("First queued") < captured.out.index("Second queued")
+        assert "[WARNING]" in captured.out
+
+    def test_background_log_writes_to_file(self):
+        """Test that background logging writes to the log file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+
+            logger.log("INFO", "Background file message", supress=True, debug=False, self_debug=False)
+            Logger.flush(timeout=5)
+
+            with open(os.path.join(tmpdir, os.listdir(tmpdir)[0]), 'r') as f:
+                assert "Background file message" in f.read()
+
+    @pytest.mark.skipif(os.name != "posix", reason="fcntl is POSIX-only")
+    def test_file_output_uses_raw_append_descriptor(self):
+        """Test that file records are pre-encoded bytes written with os.write on an O_APPEND fd."""
+        import fcntl
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False)
+
+            with patch("steely.logger._write_fd", wraps=os.write) as mock_write:
+                logger.log("INFO", "Raw message", supress=True, debug=False, self_debug=False)
+
+            mock_write.assert_called_once()
+            fd, data = mock_write.call_args[0]
+            assert fd == logger._log_fd
+            assert isinstance(data, bytes) and data.endswith(b"Raw message")
+            assert fcntl.fcntl(fd, fcntl.F_GETFL) & os.O_APPEND
+
+    def test_background_file_output_written_in_one_batch(self):
+        """Test that buffered file lines are coalesced into a single write."""
+        import time
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+            now = time.time()
+
+            logger._subprocess_log((now, "INFO", "First", None, False, False, {}))
+            logger._subprocess_log((now, "INFO", "Second", None, False, False, {}))
+
+            log_file = os.path.join(tmpdir, os.listdir(tmpdir)[0])
+            assert os.path.getsize(log_file) == 0
+
+            with patch("steely.logger._write_fd", wraps=os.write) as mock_write:
+                logger._flush_file()
+
+                mock_write.assert_called_once()
+
+            with open(log_file, 'r') as f:
+                content = f.read()
+            assert content.index("First") < content.index("Second")
+
+    def test_background_burst_written_once_per_file(self):
+        """Test that a burst spanning several listener batches reaches the file in one write."""
+        import time
+        from steely.logger import _BATCH_SIZE
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+            count = _BATCH_SIZE * 4 + 10
+            now = time.time()
+
+            # Queue the burst without waking the listener, as a fast producer would
+            for i in range(count):
+                Logger._ring.append((logger, (now, "INFO", f"Burst {i}", None, False, False, {})))
+
+            with patch("steely.logger._write_fd", wraps=os.write) as mock_write:
+                assert Logger.flush(timeout=5) is True
+
+            file_writes = [c for c in mock_write.call_args_list if c[0][0] == logger._log_fd]
+            assert len(file_writes) == 1
+
+            with open(os.path.join(tmpdir, os.listdir(tmpdir)[0]), 'r') as f:
+                assert f.read().count("Burst ") == count
+
+    def test_background_terminal_output_written_in_one_batch(self, capsys):
+        """Test that buffered terminal lines are coalesced into a single write."""
+        import time
+        from steely.logger import _emit
+        logger = Logger("owner", "app", background=True)
+        now = time.time()
+
+        logger._subprocess_log((now, "INFO", "First echo", None, False, True, {}))
+        logger._subprocess_log((now, "WARNING", "Second echo", None, False, True, {}))
+
+        assert capsys.readouterr().out == ""
+
+        with patch("steely.logger._emit", wraps=_emit) as mock_emit:
+            Logger._flush_echo()
+
+            mock_emit.assert_called_once()
+
+        captured = capsys.readouterr()
+        assert captured.out.index("First echo") < captured.out.index("Second echo")
+
+    def test_background_listener_is_shared(self):
+        """Test that all background loggers share one listener thread."""
+        Logger("owner1", background=True)
+        thread = Logger._listener_thread
+        Logger("owner2", background=True)
+
+        assert Logger._listener_thread is thread
+        assert thread.daemon is True
+
+    def test_foreground_log_does_not_enqueue(self, capsys):
+        """Test that the default logger writes on the calling thread."""
+        logger = Logger("owner", "app")
+
+        with patch.object(Logger, "_ring") as mock_ring:
+            logger.log("INFO", "Direct message", supress=False, debug=True)
+
+            mock_ring.append.assert_not_called()
+
+    def test_background_full_ring_drops_and_reports(self, capsys):
+        """Test that records are dropped when the ring is full and the count is reported once."""
+        logger = Logger("owner", "app", background=True)
+        logger.info("Before overflow")
+        Logger.flush(timeout=5)
+
+        with patch("steely.logger._RING_SIZE", 0):
+            logger.info("Dropped one")
+            logger.info("Dropped two")
+        assert Logger.flush(timeout=5) is True
+
+        captured = capsys.readouterr()
+        assert "Before overflow" in captured.out
+        assert "Dropped one" not in captured.out
+        assert captured.out.count("2 messages dropped") == 1
+        assert Logger._dropped == {}
+
+    def test_background_drops_reported_by_the_dropping_logger(self):
+        """Test that each logger's drop warning lands in its own file."""
+        with tempfile.TemporaryDirectory() as dir_a, tempfile.TemporaryDirectory() as dir_b:
+            logger_a = Logger("owner", "alpha", destination=dir_a, debug=False, background=True)
+            logger_b = Logger("owner", "beta", destination=dir_b, debug=False, background=True)
+
+            with patch("steely.logger._RING_SIZE", 0):
+                for i in range(3):
+                    logger_a.log("INFO", f"Dropped A{i}", supress=True, debug=False, self_debug=False)
+                logger_b.log("INFO", "Dropped B", supress=True, debug=False, self_debug=False)
+            # B's record is processed last, so a single shared report would land in B's file
+            logger_b.log("INFO", "Kept B", supress=True, debug=False, self_debug=False)
+            assert Logger.flush(timeout=5) is True
+
+            with open(os.path.join(dir_a, os.listdir(dir_a)[0]), 'r') as f:
+                content_a = f.read()
+            with open(os.path.join(dir_b, os.listdir(dir_b)[0]), 'r') as f:
+                content_b = f.read()
+
+        assert "[ALPHA]" in content_a and "3 messages dropped" in content_a
+        assert "1 messages dropped" in content_b and "3 messages dropped" not in content_b
+        assert "Kept B" in content_b
+
+    def test_background_flush_waits_for_drop_warnings(self):
+        """Test that a flush landing in the same batch still writes the drop warning."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger = Logger("owner", "app", destination=temp_dir, debug=False, background=True)
+            logger.log("INFO", "Started", supress=True, debug=False, self_debug=False)
+            assert Logger.flush(timeout=5) is True
+
+            # Hold the listener back so the record and the marker share one batch
+            with patch.object(Logger._wakeup, "set"):
+                with patch("steely.logger._RING_SIZE", 0):
+                    logger.log("INFO", "Dropped", supress=True, debug=False, self_debug=False)
+                logger.log("INFO", "Kept", supress=True, debug=False, self_debug=False)
+                snapshots = []
+
+                class Marker(threading.Event):
+                    def set(self):
+                        # What flush() callers see the moment they are released
+                        with open(os.path.join(temp_dir, os.listdir(temp_dir)[0]), 'r') as f:
+                            snapshots.append(f.read())
+                        super().set()
+
+                done = Marker()
+                Logger._ring.append((None, done))
+            Logger._wakeup.set()
+            assert done.wait(5) is True
+
+        assert "Kept" in snapshots[0]
+        assert "1 messages dropped" in snapshots[0]
+
+    def test_background_block_when_full_waits_instead_of_dropping(self):
+        """Test that block_when_full loggers wait for the listener rather than drop records."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+            logger.block_when_full = True
+
+            with patch("steely.logger._RING_SIZE", 2):
+                for i in range(50):
+                    logger.log("INFO", f"Record {i}", supress=True, debug=False, self_debug=False)
+            assert Logger.flush(timeout=5) is True
+
+            with open(os.path.join(tmpdir, os.listdir(tmpdir)[0]), 'r') as f:
+                content = f.read()
+
+        assert content.count("Record ") == 50
+        assert "messages dropped" not in content
+
+    def test_background_block_when_full_drops_without_listener(self):
+        """Test that block_when_full does not wait forever when no listener is alive."""
+        import threading
+        logger = Logger("owner", "app", debug=False, background=True)
+        logger.block_when_full = True
+        dead = threading.Thread(target=lambda: None)
+        dead.start()
+        dead.join()
+
+        with patch.object(Logger, "_listener_thread", dead), patch("steely.logger._RING_SIZE", 0):
+            assert logger.info("Nowhere to go") == ""
+
+        assert Logger._dropped.pop(logger) == 1
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is POSIX-only")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_background_logging_in_forked_child(self):
+        """Test that a forked child gets its own listener and parent records are not duplicated."""
+        import time
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+            logger.log("INFO", "Parent before fork", supress=True, debug=False, self_debug=False)
+            assert Logger.flush(timeout=5) is True
+
+            # Queued but not yet written when the child is forked
+            Logger._ring.append((logger, (time.time(), "INFO", "Parent pending", None, False, False, {})))
+            pid = os.fork()
+            if pid == 0:
+                ok = False
+                try:
+                    logger.log("INFO", "Child record", supress=True, debug=False, self_debug=False)
+                    ok = Logger.flush(timeout=5)
+                finally:
+                    os._exit(0 if ok else 1)
+            _, status = os.waitpid(pid, 0)
+            assert Logger.flush(timeout=5) is True
+
+            with open(os.path.join(tmpdir, os.listdir(tmpdir)[0]), 'r') as f:
+                content = f.read()
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert "Child record" in content
+        assert content.count("Parent pending") == 1
+
+    def test_background_many_producer_threads(self):
+        """Test that concurrent producers lose no records and keep per-thread order."""
+        import re
+        import threading
+        threads_count, per_thread = 4, 500
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True)
+            logger.block_when_full = True
+
+            def produce(t):
+                for i in range(per_thread):
+                    logger.log("INFO", f"T{t} R{i}", supress=True, debug=False, self_debug=False)
+
+            threads = [threading.Thread(target=produce, args=(t,)) for t in range(threads_count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert Logger.flush(timeout=5) is True
+
+            with open(os.path.join(tmpdir, os.listdir(tmpdir)[0]), 'r') as f:
+                records = re.findall(r"T(\d+) R(\d+)", f.read())
+
+        assert len(records) == threads_count * per_thread
+        for t in range(threads_count):
+            assert [int(i) for tid, i in records if int(tid) == t] == list(range(per_thread))
+
+
+class TestLoggerBinary:
+    """Tests for binary log files."""
+
+    def test_binary_records_round_trip(self):
+        """Test that binary records are read back with level, time and message."""
+        import time
+        from steely.logger import read_binary_log
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, binary=True)
+            before = time.time()
+
+            logger.log("INFO", "First", supress=True, debug=False, self_debug=False)
+            logger.log("error", "Sécond", supress=True, debug=False, self_debug=False)
+            logger.log("CUSTOM", "Third", supress=True, debug=False, self_debug=False)
+
+            (filename,) = os.listdir(tmpdir)
+            assert filename.endswith(".bin")
+            records = list(read_binary_log(os.path.join(tmpdir, filename)))
+
+        assert [(level, message) for level, _, message in records] == [
+            ("INFO", "First"), ("ERROR", "Sécond"), (None, "Third")
+        ]
+        assert all(before <= created <= time.time() for _, created, _ in records)
+
+    def test_binary_file_only_record_is_not_formatted(self):
+        """Test that a binary record with no terminal output skips the text line."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, binary=True)
+
+            content = logger.log("INFO", "Quiet", supress=True, debug=False, self_debug=False)
+
+            assert content == ""
+
+    def test_binary_record_still_echoed_as_text(self, capsys):
+        """Test that the terminal keeps receiving readable lines in binary mode."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, binary=True)
+
+            content = logger.log("INFO", "Loud", supress=False, debug=True)
+
+        assert content.endswith("[APP] [OWNER] [INFO]: Loud")
+        assert "Loud" in capsys.readouterr().out
+
+    def test_binary_background_records_written_on_flush(self):
+        """Test that background binary records are batched and written by the listener."""
+        from steely.logger import read_binary_log
+        with tempfile.TemporaryDirectory() as tmpdir:
+            logger = Logger("owner", "app", destination=tmpdir, debug=False, background=True, binary=True)
+
+            logger.log("INFO", "One", supress=True, debug=False, self_debug=False)
+            logger.log("INFO", "Two", supress=True, debug=False, self_debug=False)
+            assert Logger.flush(timeout=5) is True
+
+            (filename,) = os.listdir(tmpdir)
+            messages = [message for _, _, message in read_binary_log(os.path.join(tmpdir, filename))]
+
+        assert messages == ["One", "Two"]
+
 
 class TestLoggerCallable:
     """Tests for Logger __call__ method."""
@@ -215,16 +722,25 @@ class TestLoggerCallable:
         """Test that Logger instance is callable."""
         logger = Logger("owner", "app")
 
-        with patch.object(logger, 'log') as mock_log:
+        with patch.object(Logger, 'log') as mock_log:
             logger("INFO", "Callable message")
 
             mock_log.assert_called_once_with("INFO", "Callable message")
 
+    def test_logger_callable_returns_content(self, capsys):
+        """Test that calling the Logger returns the formatted content like log()."""
+        logger = Logger("owner", "app")
+
+        content = logger("INFO", "Callable message")
+
+        assert "[INFO]" in content
+        assert "Callable message" in content
+
     def test_logger_callable_with_kwargs(self):
         """Test Logger callable with kwargs."""
         logger = Logger("owner", "app")
 
-        with patch.object(logger, 'log') as mock_log:
+        with patch.object(Logger, 'log') as mock_log:
             logger("ERROR", "Error", app_name="test", clean=True)
 
             mock_log.assert_called_once_with("ERROR", "Error", app_name="test", clean=True)
@@ -258,19 +774,95 @@ class TestLoggerLevelColors:
         assert str(expected_color) in captured.out
 
 
+class TestLoggerColorDetection:
+    """Tests for ANSI color detection."""
+
+    def test_supports_color_false_for_non_tty(self, monkeypatch):
+        """Test that colors are disabled when the stream is not a TTY."""
+        from io import StringIO
+        from steely.design import supports_color
+        monkeypatch.delenv("STEELY_FORCE_COLOR", raising=False)
+        monkeypatch.delenv("NO_COLOR", raising=False)
+
+        assert supports_color(StringIO()) is False
+
+    def test_supports_color_forced_by_env(self, monkeypatch):
+        """Test that STEELY_FORCE_COLOR enables colors on a non-TTY stream."""
+        from io import StringIO
+        from steely.design import supports_color
+        monkeypatch.setenv("STEELY_FORCE_COLOR", "1")
+
+        assert supports_color(StringIO()) is True
+
+    def test_supports_color_disabled_by_no_color(self, monkeypatch):
+        """Test that NO_COLOR disables colors."""
+        from steely.design import supports_color
+        monkeypatch.delenv("STEELY_FORCE_COLOR", raising=False)
+        monkeypatch.setenv("NO_COLOR", "1")
+
+        assert supports_color() is False
+
+    def test_log_without_colors_writes_plain_line(self, capsys):
+        """Test that no escape codes are written when colors are disabled."""
+        logger = Logger("owner", "app")
+        logger._use_color = False
+
+        logger.log("INFO", "Plain message", supress=False, debug=True)
+
+        captured = capsys.readouterr()
+        assert "\033[" not in captured.out
+        assert captured.out.endswith("[APP] [OWNER] [INFO]: Plain message\n")
+
+    def test_logger_decides_colors_at_construction(self, monkeypatch):
+        """Test that each logger checks color support when it is created."""
+        monkeypatch.delenv("STEELY_FORCE_COLOR", raising=False)
+        monkeypatch.setenv("NO_COLOR", "1")
+        plain = Logger("owner", "app")
+
+        monkeypatch.setenv("STEELY_FORCE_COLOR", "1")
+        colored = Logger("owner", "app")
+
+        assert plain._use_color is False
+        assert colored._use_color is True
+
+
 class TestLoggerCleanFlag:
     """Tests for Logger clean screen functionality."""
 
-    def test_clean_flag_triggers_clear(self):
-        """Test that clean flag triggers screen clear."""
+    def test_clean_flag_triggers_clear(self, capsys):
+        """Test that clean flag clears the screen with an ANSI escape."""
         logger = Logger("owner", "app")
         logger.clean = True
 
+        with patch('os.system') as mock_system:
+            logger.log("INFO", "Message", clean=False, supress=False, debug=True)
+
+            mock_system.assert_not_called()
+
+        captured = capsys.readouterr()
+        assert captured.out.startswith("\x1b[2J\x1b[H")
+
+    def test_legacy_clean_uses_os_system(self):
+        """Test that legacy_clean shells out to clear the screen."""
+        logger = Logger("owner", "app")
+        logger.legacy_clean = True
+        logger.clean = True
+
         with patch('os.system') as mock_system:
             logger.log("INFO", "Message", clean=False, supress=False, debug=True)
 
             mock_system.assert_called_once()
 
+    def test_clean_falls_back_to_os_system_without_ansi(self):
+        """Test that consoles without ANSI support still get cleared."""
+        logger = Logger("owner", "app")
+        logger.clean = True
+
+        with patch("steely.logger._ANSI_TERMINAL", False), patch('os.system') as mock_system:
+            logger.log("INFO", "Message", clean=False, supress=False, debug=True)
+
+            mock_system.assert_called_once()
+
     def test_master_clean_keeps_clean_flag(self):
         """Test that master_clean keeps clean flag True."""
         logger = Logger("owner", "app", clean=True)
@@ -296,6 +888,16 @@ class TestRelativeFunction:
         # Just verify it's constructing a path with the filename
         assert result.endswith("test.txt")
 
+    def test_relative_joins_onto_module_directory(self):
+        """Test relative returns an absolute path inside the logger package."""
+        import steely.logger
+        from steely.logger import relative
+
+        result = relative(os.path.join("templates", "email.html"))
+
+        assert os.path.isabs(result)
+        assert result == os.path.join(os.path.dirname(os.path.abspath(steely.logger.__file__)), "templates", "email.html")
+
 
 class TestLoggerSetAppName:
     """Tests for Logger.set_app_name instance method."""
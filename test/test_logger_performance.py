@@ -15,7 +15,8 @@ Expected Results:
 -----------------
 Python's built-in logging is significantly faster than steely Logger because:
 1. Python logging is synchronous and writes directly to files
-2. Steely Logger uses threading for each log message, adding overhead
+2. Steely Logger hands each message to a shared background worker thread,
+   so the measured time includes draining that worker
 3. Steely Logger has additional formatting and color processing
 
 However, Steely Logger provides benefits in production scenarios:
@@ -28,28 +29,24 @@ Use Cases:
 ----------
 - Use Python logging for: High-throughput applications, batch processing
 - Use Steely Logger for: Development, debugging, real-time monitoring, user-facing applications
+
+Running:
+--------
+Every benchmark writes to its own pytest temporary directory, so the cases
+can run in parallel workers with pytest-xdist:
+
+    pytest -n auto -s test/test_logger_performance.py
+
+Workers share the machine, so compare timings from the same kind of run.
 """
 
 import logging
 import os
-import shutil
-import sys
-import tempfile
 import time
-from contextlib import contextmanager
-from io import StringIO
-
-from steely.logger import Logger
 
+import pytest
 
-@contextmanager
-def temporary_directory():
-    """Create a temporary directory and clean it up afterwards."""
-    temp_dir = tempfile.mkdtemp()
-    try:
-        yield temp_dir
-    finally:
-        shutil.rmtree(temp_dir, ignore_errors=True)
+from steely.logger import Logger
 
 
 def setup_python_logger(log_path: str) -> logging.Logger:
@@ -120,7 +117,38 @@ def benchmark_python_logger(num_messages: int, log_path: str) -> float:
     return end_time - start_time
 
 
-def benchmark_steely_logger(num_messages: int, log_path: str) -> float:
+def create_steely_logger(log_path: str) -> Logger:
+    """
+    Create the steely Logger used by the benchmarks.
+
+    The logger writes through the background worker and is warmed up with
+    one message, so the log file is already open when timing starts.
+
+    Parameters
+    ----------
+    log_path : str
+        Path to the log directory.
+
+    Returns
+    -------
+    Logger
+        Ready-to-use logger instance.
+    """
+    logger = Logger("TestOwner", "TestApp", destination=log_path, debug=False, background=True)
+    # Measure every message: wait for the worker instead of dropping on overflow
+    logger.block_when_full = True
+    logger.info("Warm-up", supress=True, debug=False)
+    Logger.flush()
+    return logger
+
+
+def reset_log_files(logger: Logger):
+    """Truncate the log files of a logger so each run starts from empty files."""
+    for filename in os.listdir(logger.path):
+        open(os.path.join(logger.path, filename), 'wb').close()
+
+
+def benchmark_steely_logger(num_messages: int, logger: Logger) -> float:
     """
     Benchmark steely Logger.
 
@@ -128,154 +156,81 @@ def benchmark_steely_logger(num_messages: int, log_path: str) -> float:
     ----------
     num_messages : int
         Number of messages to log.
-    log_path : str
-        Path to the log directory.
+    logger : Logger
+        Logger created by create_steely_logger().
 
     Returns
     -------
     float
         Time taken in seconds.
     """
-    logger = Logger("TestOwner", "TestApp", destination=log_path, debug=False)
-
-    # Suppress stdout to prevent console output from affecting benchmarks
-    old_stdout = sys.stdout
-    sys.stdout = StringIO()
-
     start_time = time.perf_counter()
 
+    # supress=True on a debug=False logger skips terminal output entirely
     for i in range(num_messages):
         logger.info(f"Test message {i}", supress=True, debug=False)
 
-    # Wait for threads to complete
-    # Give extra time for threading operations
-    time.sleep(0.5)
+    # Wait until the background worker has written every message
+    Logger.flush()
 
     end_time = time.perf_counter()
 
-    # Restore stdout
-    sys.stdout = old_stdout
-
     return end_time - start_time
 
 
-def test_single_message_performance():
-    """Test performance of a single log message."""
-    print("\n" + "="*80)
-    print("TEST: Single Message Performance")
-    print("="*80)
-
-    with temporary_directory() as temp_dir:
-        # Python logger
-        python_log_file = os.path.join(temp_dir, "python_single.log")
-        python_time = benchmark_python_logger(1, python_log_file)
-
-        # Steely logger
-        steely_log_dir = os.path.join(temp_dir, "steely_single")
-        steely_time = benchmark_steely_logger(1, steely_log_dir)
-
-        print(f"\nPython logging: {python_time*1000:.4f} ms")
-        print(f"Steely Logger:  {steely_time*1000:.4f} ms")
-
-        if python_time < steely_time:
-            diff_percent = ((steely_time - python_time) / python_time) * 100
-            print(f"\nPython is faster by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_time - steely_time) / steely_time) * 100
-            print(f"\nSteely is faster by {diff_percent:.2f}%")
-
-
-def test_batch_performance_1000():
-    """Test performance with 1000 messages."""
-    print("\n" + "="*80)
-    print("TEST: Batch Performance (1,000 messages)")
-    print("="*80)
-
-    num_messages = 1000
-
-    with temporary_directory() as temp_dir:
-        # Python logger
-        python_log_file = os.path.join(temp_dir, "python_1000.log")
-        python_time = benchmark_python_logger(num_messages, python_log_file)
-        python_throughput = num_messages / python_time
-
-        # Steely logger
-        steely_log_dir = os.path.join(temp_dir, "steely_1000")
-        steely_time = benchmark_steely_logger(num_messages, steely_log_dir)
-        steely_throughput = num_messages / steely_time
-
-        print(f"\nPython logging: {python_time:.4f} seconds ({python_throughput:.0f} msg/s)")
-        print(f"Steely Logger:  {steely_time:.4f} seconds ({steely_throughput:.0f} msg/s)")
-
-        if python_time < steely_time:
-            diff_percent = ((steely_time - python_time) / python_time) * 100
-            print(f"\nPython is faster by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_time - steely_time) / steely_time) * 100
-            print(f"\nSteely is faster by {diff_percent:.2f}%")
-
+def compare_batch_performance(num_messages: int, steely_logger: Logger, temp_dir: str):
+    """
+    Print the timing of both loggers for a batch of messages.
 
-def test_batch_performance_10000():
-    """Test performance with 10,000 messages."""
+    Parameters
+    ----------
+    num_messages : int
+        Number of messages to log.
+    steely_logger : Logger
+        Logger created by create_steely_logger().
+    temp_dir : str
+        Directory for the Python log file.
+    """
     print("\n" + "="*80)
-    print("TEST: Batch Performance (10,000 messages)")
+    print(f"TEST: Batch Performance ({num_messages:,} messages)")
     print("="*80)
 
-    num_messages = 10000
-
-    with temporary_directory() as temp_dir:
-        # Python logger
-        python_log_file = os.path.join(temp_dir, "python_10000.log")
-        python_time = benchmark_python_logger(num_messages, python_log_file)
-        python_throughput = num_messages / python_time
-
-        # Steely logger
-        steely_log_dir = os.path.join(temp_dir, "steely_10000")
-        steely_time = benchmark_steely_logger(num_messages, steely_log_dir)
-        steely_throughput = num_messages / steely_time
+    # Python logger
+    python_log_file = os.path.join(temp_dir, f"python_{num_messages}.log")
+    python_time = benchmark_python_logger(num_messages, python_log_file)
+    python_throughput = num_messages / python_time
 
-        print(f"\nPython logging: {python_time:.4f} seconds ({python_throughput:.0f} msg/s)")
-        print(f"Steely Logger:  {steely_time:.4f} seconds ({steely_throughput:.0f} msg/s)")
+    # Steely logger
+    reset_log_files(steely_logger)
+    steely_time = benchmark_steely_logger(num_messages, steely_logger)
+    steely_throughput = num_messages / steely_time
 
-        if python_time < steely_time:
-            diff_percent = ((steely_time - python_time) / python_time) * 100
-            print(f"\nPython is faster by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_time - steely_time) / steely_time) * 100
-            print(f"\nSteely is faster by {diff_percent:.2f}%")
-
-
-def test_batch_performance_100000():
-    """Test performance with 100,000 messages."""
-    print("\n" + "="*80)
-    print("TEST: Batch Performance (100,000 messages)")
-    print("="*80)
+    print(f"\nPython logging: {python_time:.4f} seconds ({python_throughput:.0f} msg/s)")
+    print(f"Steely Logger:  {steely_time:.4f} seconds ({steely_throughput:.0f} msg/s)")
 
-    num_messages = 100000
+    if python_time < steely_time:
+        diff_percent = ((steely_time - python_time) / python_time) * 100
+        print(f"\nPython is faster by {diff_percent:.2f}%")
+    else:
+        diff_percent = ((python_time - steely_time) / steely_time) * 100
+        print(f"\nSteely is faster by {diff_percent:.2f}%")
 
-    with temporary_directory() as temp_dir:
-        # Python logger
-        python_log_file = os.path.join(temp_dir, "python_100000.log")
-        python_time = benchmark_python_logger(num_messages, python_log_file)
-        python_throughput = num_messages / python_time
 
-        # Steely logger
-        steely_log_dir = os.path.join(temp_dir, "steely_100000")
-        steely_time = benchmark_steely_logger(num_messages, steely_log_dir)
-        steely_throughput = num_messages / steely_time
+@pytest.fixture(scope="module")
+def steely_logger(tmp_path_factory):
+    """One steely Logger shared by every benchmark in this module."""
+    logger = create_steely_logger(str(tmp_path_factory.mktemp("steely")))
+    yield logger
+    Logger.flush()
 
-        print(f"\nPython logging: {python_time:.4f} seconds ({python_throughput:.0f} msg/s)")
-        print(f"Steely Logger:  {steely_time:.4f} seconds ({steely_throughput:.0f} msg/s)")
 
-        if python_time < steely_time:
-            diff_percent = ((steely_time - python_time) / python_time) * 100
-            print(f"\nPython is faster by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_time - steely_time) / steely_time) * 100
-            print(f"\nSteely is faster by {diff_percent:.2f}%")
+@pytest.mark.parametrize("num_messages", [1, 1000, 10000, 100000])
+def test_batch_performance(num_messages, steely_logger, tmp_path):
+    """Test performance of logging a batch of messages."""
+    compare_batch_performance(num_messages, steely_logger, str(tmp_path))
 
 
-def test_console_output_performance():
+def test_console_output_performance(tmp_path):
     """Test performance with console output enabled."""
     print("\n" + "="*80)
     print("TEST: Console Output Performance (1,000 messages)")
@@ -283,94 +238,72 @@ def test_console_output_performance():
 
     num_messages = 1000
 
-    with temporary_directory() as temp_dir:
-        # Python logger with console output
-        python_log_file = os.path.join(temp_dir, "python_console.log")
-        logger = setup_python_logger(python_log_file)
-
-        # Add console handler
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        logger.addHandler(console_handler)
-
-        start_time = time.perf_counter()
-        for i in range(num_messages):
-            logger.info(f"Test message {i}")
-        for handler in logger.handlers:
-            handler.flush()
-        python_time = time.perf_counter() - start_time
-
-        # Steely logger with console output (debug=True)
-        steely_log_dir = os.path.join(temp_dir, "steely_console")
-        logger_steely = Logger("TestOwner", "TestApp", destination=steely_log_dir, debug=True)
-
-        start_time = time.perf_counter()
-        for i in range(num_messages):
-            logger_steely.info(f"Test message {i}")
-        time.sleep(0.5)  # Wait for threads
-        steely_time = time.perf_counter() - start_time
-
-        print(f"\nPython logging (with console): {python_time:.4f} seconds")
-        print(f"Steely Logger (with console):  {steely_time:.4f} seconds")
-
-        if python_time < steely_time:
-            diff_percent = ((steely_time - python_time) / python_time) * 100
-            print(f"\nPython is faster by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_time - steely_time) / steely_time) * 100
-            print(f"\nSteely is faster by {diff_percent:.2f}%")
-
-
-def test_file_size_comparison():
-    """Compare the file sizes generated by both loggers."""
-    print("\n" + "="*80)
-    print("TEST: Log File Size Comparison (10,000 messages)")
-    print("="*80)
-
-    num_messages = 10000
-
-    with temporary_directory() as temp_dir:
-        # Python logger
-        python_log_file = os.path.join(temp_dir, "python_size.log")
-        benchmark_python_logger(num_messages, python_log_file)
-        python_size = os.path.getsize(python_log_file)
+    # Python logger with console output
+    python_log_file = os.path.join(tmp_path, "python_console.log")
+    logger = setup_python_logger(python_log_file)
 
-        # Steely logger
-        steely_log_dir = os.path.join(temp_dir, "steely_size")
-        benchmark_steely_logger(num_messages, steely_log_dir)
+    # Add console handler
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    logger.addHandler(console_handler)
 
-        # Find the steely log file
-        steely_files = os.listdir(steely_log_dir)
-        steely_log_file = os.path.join(steely_log_dir, steely_files[0])
-        steely_size = os.path.getsize(steely_log_file)
+    start_time = time.perf_counter()
+    for i in range(num_messages):
+        logger.info(f"Test message {i}")
+    for handler in logger.handlers:
+        handler.flush()
+    python_time = time.perf_counter() - start_time
 
-        print(f"\nPython log file size: {python_size:,} bytes ({python_size/1024:.2f} KB)")
-        print(f"Steely log file size: {steely_size:,} bytes ({steely_size/1024:.2f} KB)")
+    # Steely logger with console output (debug=True)
+    steely_log_dir = os.path.join(tmp_path, "steely_console")
+    logger_steely = Logger("TestOwner", "TestApp", destination=steely_log_dir, debug=True, background=True)
+    logger_steely.block_when_full = True
 
-        if python_size < steely_size:
-            diff_percent = ((steely_size - python_size) / python_size) * 100
-            print(f"\nSteely files are larger by {diff_percent:.2f}%")
-        else:
-            diff_percent = ((python_size - steely_size) / steely_size) * 100
-            print(f"\nPython files are larger by {diff_percent:.2f}%")
+    start_time = time.perf_counter()
+    for i in range(num_messages):
+        logger_steely.info(f"Test message {i}")
+    Logger.flush()  # Wait until the worker has printed and written everything
+    steely_time = time.perf_counter() - start_time
 
+    print(f"\nPython logging (with console): {python_time:.4f} seconds")
+    print(f"Steely Logger (with console):  {steely_time:.4f} seconds")
 
-def run_all_benchmarks():
-    """Run all performance benchmarks."""
-    print("\n" + "="*80)
-    print("STEELY LOGGER vs PYTHON LOGGING - PERFORMANCE COMPARISON")
-    print("="*80)
+    if python_time < steely_time:
+        diff_percent = ((steely_time - python_time) / python_time) * 100
+        print(f"\nPython is faster by {diff_percent:.2f}%")
+    else:
+        diff_percent = ((python_time - steely_time) / steely_time) * 100
+        print(f"\nSteely is faster by {diff_percent:.2f}%")
 
-    test_single_message_performance()
-    test_batch_performance_1000()
-    test_batch_performance_10000()
-    test_batch_performance_100000()
-    test_file_size_comparison()
 
+def test_file_size_comparison(steely_logger, tmp_path):
+    """Compare the file sizes generated by both loggers."""
     print("\n" + "="*80)
-    print("BENCHMARK COMPLETE")
+    print("TEST: Log File Size Comparison (10,000 messages)")
     print("="*80)
 
+    num_messages = 10000
 
-if __name__ == "__main__":
-    run_all_benchmarks()
\ No newline at end of file
+    # Python logger
+    python_log_file = os.path.join(tmp_path, "python_size.log")
+    benchmark_python_logger(num_messages, python_log_file)
+    python_size = os.path.getsize(python_log_file)
+
+    # Steely logger
+    reset_log_files(steely_logger)
+    benchmark_steely_logger(num_messages, steely_logger)
+
+    # Find the steely log file
+    steely_files = os.listdir(steely_logger.path)
+    steely_log_file = os.path.join(steely_logger.path, steely_files[0])
+    steely_size = os.path.getsize(steely_log_file)
+
+    print(f"\nPython log file size: {python_size:,} bytes ({python_size/1024:.2f} KB)")
+    print(f"Steely log file size: {steely_size:,} bytes ({steely_size/1024:.2f} KB)")
+
+    if python_size < steely_size:
+        diff_percent = ((steely_size - python_size) / python_size) * 100
+        print(f"\nSteely files are larger by {diff_percent:.2f}%")
+    else:
+        diff_percent = ((python_size - steely_size) / steely_size) * 100
+        print(f"\nPython files are larger by {diff_percent:.2f}%")
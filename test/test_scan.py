@@ -1,4 +1,5 @@
 import asyncio
+import importlib
 import pytest
 from unittest.mock import patch, MagicMock
 from io import StringIO
@@ -8,6 +9,10 @@ from steely import Dan
 from steely.scan import scan, ScanPrinter, VariableTracker
 from steely.design import TypeColors, Symbols, UnicodeColors
 
+# "steely.scan" as an attribute path resolves to the re-exported scan()
+# function on Python < 3.11, so patches target the module object itself
+scan_module = importlib.import_module("steely.scan")
+
 
 class TestScanDecorator:
     """Tests for the scan decorator."""
@@ -179,6 +184,18 @@ class TestScanDecorator:
 
         assert asyncio.iscoroutinefunction(async_func)
 
+    def test_decorator_dispatches_once_at_decoration(self, capsys):
+        """Test that calls to a scanned function do not re-check sync vs async."""
+        @Dan.scan
+        def repeated(x):
+            return x
+
+        with patch.object(scan_module.asyncio, "iscoroutinefunction") as mock_check:
+            for i in range(3):
+                assert repeated(i) == i
+
+        mock_check.assert_not_called()
+
 
 class TestScanPrinter:
     """Tests for the ScanPrinter class."""
@@ -219,6 +236,16 @@ class TestScanPrinter:
         assert "123.456ms" in captured.out
         assert "Completed" in captured.out
 
+    def test_blocks_are_printed_in_one_call(self):
+        """Test that each multi-line block reaches stdout in a single print."""
+        for method, args in ((ScanPrinter.header, ("func", "module")),
+                             (ScanPrinter.return_value, (42,)),
+                             (ScanPrinter.exception, (ValueError("bad"),)),
+                             (ScanPrinter.footer, (1.0,))):
+            with patch("builtins.print") as mock_print:
+                method(*args)
+            mock_print.assert_called_once()
+
     def test_format_value_truncates_long_strings(self):
         """Test that long values are truncated."""
         long_string = "a" * 100
@@ -227,6 +254,13 @@ class TestScanPrinter:
         assert len(result) <= 20
         assert result.endswith(Symbols.ELLIPSIS)
 
+    def test_format_value_large_containers_match_full_repr(self):
+        """Test that large containers are truncated exactly as their full repr would be."""
+        for value in (list(range(1000)), tuple(range(1000)), {i: i for i in range(1000)}):
+            for max_len in (2, 20, 40):
+                full = repr(value)[:max_len - 1] + Symbols.ELLIPSIS
+                assert ScanPrinter._format_value(value, max_len=max_len) == full
+
     def test_format_value_preserves_short_strings(self):
         """Test that short values are not truncated."""
         short_string = "hello"
@@ -264,6 +298,23 @@ class TestScanPrinter:
         result = ScanPrinter._get_type_name({1, 2})
         assert result == "set[2]"
 
+    def test_get_type_name_for_scalars(self):
+        """Test type names for scalars that are looked up by exact type."""
+        assert ScanPrinter._get_type_name(True) == "bool"
+        assert ScanPrinter._get_type_name(1.5) == "float"
+        assert ScanPrinter._get_type_name(None) == "NoneType"
+        assert ScanPrinter._get_type_name(b"ab") == "bytes"
+
+    def test_get_type_name_for_subclasses(self):
+        """Test that subclasses keep their own name and size information."""
+        from collections import OrderedDict
+
+        class Tags(list):
+            pass
+
+        assert ScanPrinter._get_type_name(Tags([1, 2])) == "Tags[2]"
+        assert ScanPrinter._get_type_name(OrderedDict(a=1)) == "OrderedDict{1}"
+
 
 class TestTypeColors:
     """Tests for TypeColors class."""
@@ -323,6 +374,24 @@ class TestTypeColors:
         assert TypeColors.get_color(True) == TypeColors.BOOL
         assert TypeColors.get_color(True) != TypeColors.INT
 
+    def test_get_color_for_builtin_subclasses(self):
+        """Test that subclasses of built-in types still get their base type color."""
+        from collections import OrderedDict
+
+        class Tags(list):
+            pass
+
+        assert TypeColors.get_color(Tags()) == TypeColors.LIST
+        assert TypeColors.get_color(OrderedDict()) == TypeColors.DICT
+
+    def test_get_color_respects_subclass_overrides(self):
+        """Test that a TypeColors subclass can override colors of built-in types."""
+        class MyColors(TypeColors):
+            INT = "<int>"
+
+        assert MyColors.get_color(42) == "<int>"
+        assert TypeColors.get_color(42) == TypeColors.INT
+
 
 class TestSymbols:
     """Tests for Symbols class."""
@@ -373,6 +442,133 @@ class TestVariableTracker:
         result = tracker.trace_calls(None, 'call', None)
         assert result is None
 
+    def test_tracker_ignores_exception_events(self):
+        """Test that exception events keep tracing without inspecting the frame."""
+        def dummy():
+            pass
+
+        tracker = VariableTracker(dummy.__code__)
+        tracker.active = True
+
+        result = tracker.trace_lines(None, 'exception', (ValueError, ValueError(), None))
+        assert result == tracker.trace_lines
+        assert tracker.changes == []
+
+    def test_tracker_reports_changes_in_assignment_order(self, capsys):
+        """Test that changes keep f_locals order with hashable and unhashable values."""
+        def dummy():
+            pass
+
+        class Frame:
+            f_code = dummy.__code__
+            f_lineno = 1
+
+        tracker = VariableTracker(dummy.__code__)
+        tracker.active = True
+        frame = Frame()
+
+        frame.f_locals = {"x": 1, "y": 2, "z": 3}
+        tracker.trace_lines(frame, 'line', None)
+        frame.f_locals = {"x": 1, "y": 5, "z": 6, "items": [1]}
+        tracker.trace_lines(frame, 'line', None)
+        frame.f_locals = {"x": 7, "y": 5, "z": 6, "items": [1, 2]}
+        tracker.trace_lines(frame, 'line', None)
+
+        assert [change[:2] for change in tracker.changes] == [
+            ('new', 'x'), ('new', 'y'), ('new', 'z'),
+            ('change', 'y'), ('change', 'z'), ('new', 'items'),
+            ('change', 'x'), ('change', 'items'),
+        ]
+
+    def test_tracker_never_hashes_local_values(self, capsys):
+        """Test that locals whose __hash__ fails do not break the scanned function."""
+        class Unhashable:
+            def __hash__(self):
+                raise AttributeError("no hash")
+
+        @Dan.scan
+        def holds_unhashable():
+            p = Unhashable()
+            q = 1
+            return q
+
+        assert holds_unhashable() == 1
+        assert "q" in capsys.readouterr().out
+
+    @pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="sys.monitoring needs Python 3.12+")
+    def test_monitoring_matches_settrace_on_single_line_loops(self, capsys):
+        """Test that loops jumping back onto their own line report every iteration."""
+        def target():
+            n = 0
+            while n < 3: n += 1
+            xs = [i * 2 for i in range(3)]
+            return xs
+
+        def changes():
+            tracker = VariableTracker(target.__code__)
+            tracker.start()
+            try:
+                target()
+            finally:
+                tracker.stop()
+            return tracker.changes
+
+        monitored = changes()
+        with patch.object(scan_module, "_tool_id", False):
+            traced = changes()
+
+        assert monitored == traced
+        assert [c[3] for c in monitored if c[:2] == ('change', 'n')] == [1, 2, 3]
+        assert any(c[1] == 'i' for c in monitored if c[0] == 'change')
+
+    def _run_tracked(self):
+        """Run a function that calls a helper under a tracker and return it."""
+        def helper(value):
+            doubled = value * 2
+            return doubled
+
+        def target():
+            a = 1
+            b = helper(a)
+            c = a + b
+            return c
+
+        tracker = VariableTracker(target.__code__)
+        tracker.start()
+        try:
+            target()
+        finally:
+            tracker.stop()
+        return tracker
+
+    @pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="sys.monitoring needs Python 3.12+")
+    def test_tracker_uses_monitoring_without_touching_settrace(self, capsys):
+        """Test that sys.monitoring tracking leaves the global trace function alone."""
+        old_trace = sys.gettrace()
+
+        with patch("sys.settrace") as mock_settrace:
+            tracker = self._run_tracked()
+
+            mock_settrace.assert_not_called()
+
+        names = [change[1] for change in tracker.changes]
+        assert {"a", "b", "c"} <= set(names)
+        assert "doubled" not in names
+        assert tracker.active is False
+        assert sys.gettrace() is old_trace
+
+    def test_tracker_falls_back_to_settrace(self, capsys):
+        """Test that tracking works through sys.settrace when monitoring is unavailable."""
+        old_trace = sys.gettrace()
+
+        with patch.object(scan_module, "_tool_id", False):
+            tracker = self._run_tracked()
+
+        names = [change[1] for change in tracker.changes]
+        assert {"a", "b", "c"} <= set(names)
+        assert "doubled" not in names
+        assert sys.gettrace() is old_trace
+
 
 class TestScanWithDifferentTypes:
     """Tests for scan decorator with various data types."""
@@ -497,6 +693,35 @@ class TestScanOutputFormat:
         assert "SCAN" in captured.out
         assert "header_test" in captured.out
 
+    def test_output_has_no_ansi_codes_without_color_support(self, capsys, monkeypatch):
+        """Test that output to a non-color stream keeps the layout but drops ANSI codes."""
+        monkeypatch.delenv("STEELY_FORCE_COLOR", raising=False)
+        monkeypatch.setenv("NO_COLOR", "1")
+
+        @Dan.scan
+        def plain_test(x):
+            y = [x, x]
+            return y
+
+        plain_test(2)
+        captured = capsys.readouterr()
+
+        assert "\033[" not in captured.out
+        assert "┌" in captured.out
+        assert "y : list[2] = [2, 2]" in captured.out
+        assert "return : list[2] = [2, 2]" in captured.out
+
+    def test_output_has_ansi_codes_with_color_support(self, capsys):
+        """Test that forced color support keeps the ANSI codes."""
+        @Dan.scan
+        def color_test():
+            return 1
+
+        color_test()
+        captured = capsys.readouterr()
+
+        assert str(UnicodeColors.bright_cyan) in captured.out
+
     def test_output_contains_box_characters(self, capsys):
         """Test that output contains box drawing characters."""
         @Dan.scan
@@ -522,6 +747,19 @@ class TestScanOutputFormat:
         assert "Completed" in captured.out
         assert "ms" in captured.out
 
+    def test_completion_time_uses_monotonic_nanoseconds(self, capsys):
+        """Test that the elapsed time comes from perf_counter_ns in milliseconds."""
+        @Dan.scan
+        def timed_test():
+            return 1
+
+        with patch.object(scan_module, "time") as mock_time:
+            mock_time.perf_counter_ns.side_effect = [1_000_000, 2_500_000]
+            timed_test()
+        captured = capsys.readouterr()
+
+        assert "1.500ms" in captured.out
+
     def test_output_shows_parameters(self, capsys):
         """Test that output shows function parameters."""
         @Dan.scan